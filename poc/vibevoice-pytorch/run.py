@@ -10,16 +10,28 @@ Environment variables:
   - HF_TOKEN: Hugging Face token for authenticated downloads
 """
 import argparse
+import contextlib
+import functools
 import hashlib
+import importlib.util
 import os
 import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import soundfile as sf
 import torch
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 # Voice prompt URLs and configurations
 VOICE_PROMPTS = {
     "Carter": {
@@ -54,6 +66,10 @@ DEFAULT_DEVICE = "mps"  # Apple Silicon
 DEFAULT_DDPM_STEPS = 5
 DEFAULT_CFG_SCALE = 1.5
 DEFAULT_SAMPLE_RATE = 22050
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+MAX_PROMPT_SECS = 3  # VibeVoice conditioner window
+MAX_CACHE_LEN = 4096  # Static KV-cache length when the LM forward is compiled
+COMPILE_MODE = "reduce-overhead"
 
 
 def get_cache_dir() -> Path:
@@ -64,6 +80,75 @@ def get_cache_dir() -> Path:
     return cache_dir
 
 
+def short_hash(text: str) -> str:
+    """Return an 8-character hex digest for cache filenames."""
+    return hashlib.md5(text.encode()).hexdigest()[:8]
+
+
+def get_compile_cache_dir() -> Path:
+    """Get the default on-disk cache directory for torch.compile artifacts."""
+    return get_cache_dir().parent / "torch_compile_cache"
+
+
+def configure_compile_cache(cache_dir: Optional[str] = None) -> Path:
+    """Enable the Inductor on-disk caches so compiled kernels survive restarts."""
+    if cache_dir:
+        os.environ["TORCHINDUCTOR_CACHE_DIR"] = cache_dir
+    else:
+        os.environ.setdefault(
+            "TORCHINDUCTOR_CACHE_DIR", str(get_compile_cache_dir())
+        )
+
+    try:
+        import torch._dynamo
+        import torch._inductor.config
+
+        torch._inductor.config.fx_graph_cache = True
+        torch._dynamo.config.cache_size_limit = 64
+        # PyTorch >= 2.4
+        if hasattr(torch._inductor.config, "force_disable_caches"):
+            torch._inductor.config.force_disable_caches = False
+        try:
+            import torch._functorch.config
+
+            if hasattr(torch._functorch.config, "enable_autograd_cache"):
+                torch._functorch.config.enable_autograd_cache = True
+        except ImportError:
+            pass
+    except ImportError as e:
+        print(f"torch.compile cache unavailable: {e}", file=sys.stderr)
+
+    return Path(os.environ["TORCHINDUCTOR_CACHE_DIR"])
+
+
+def get_hf_headers() -> dict:
+    """Get HTTP headers for Hugging Face downloads."""
+    headers = {}
+    hf_token = os.environ.get("HF_TOKEN")
+    if hf_token:
+        headers["Authorization"] = f"Bearer {hf_token}"
+    return headers
+
+
+@functools.lru_cache(maxsize=None)
+def get_http_client():
+    """Get a shared httpx client so downloads reuse one connection."""
+    try:
+        return httpx.Client(
+            http2=True,
+            timeout=60,
+            follow_redirects=True,
+            headers=get_hf_headers(),
+        )
+    except ImportError:
+        # http2=True requires the optional h2 package
+        return httpx.Client(
+            timeout=60,
+            follow_redirects=True,
+            headers=get_hf_headers(),
+        )
+
+
 def download_voice_prompt(voice: str, force: bool = False) -> Path:
     """Download and cache a voice prompt file."""
     if voice not in VOICE_PROMPTS:
@@ -75,7 +160,7 @@ def download_voice_prompt(voice: str, force: bool = False) -> Path:
     url = prompt_info["url"]
 
     # Create a deterministic filename from the URL
-    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+    url_hash = short_hash(url)
     cache_path = cache_dir / f"{voice}_{url_hash}.wav"
 
     if cache_path.exists() and not force:
@@ -84,17 +169,28 @@ def download_voice_prompt(voice: str, force: bool = False) -> Path:
     print(f"Downloading voice prompt: {voice}...", file=sys.stderr)
 
     try:
-        import urllib.request
-
-        headers = {}
-        hf_token = os.environ.get("HF_TOKEN")
-        if hf_token:
-            headers["Authorization"] = f"Bearer {hf_token}"
-
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=60) as response:
-            with open(cache_path, "wb") as f:
-                f.write(response.read())
+        # Write to a unique temp file and rename so concurrent runs never
+        # observe a partially written cache entry
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_dir, prefix=f"{cache_path.stem}.", suffix=".wav.tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if httpx is not None:
+                    with get_http_client().stream("GET", url) as response:
+                        response.raise_for_status()
+                        for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                else:
+                    import urllib.request
+
+                    req = urllib.request.Request(url, headers=get_hf_headers())
+                    with urllib.request.urlopen(req, timeout=60) as response:
+                        shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
 
         print(f"Voice prompt cached: {cache_path}", file=sys.stderr)
         return cache_path
@@ -103,12 +199,273 @@ def download_voice_prompt(voice: str, force: bool = False) -> Path:
         raise RuntimeError(f"Failed to download voice prompt: {e}") from e
 
 
+def prefetch_all_voices(max_workers: int = 6, force: bool = False) -> dict:
+    """Download all voice prompts into the cache in parallel."""
+    if httpx is not None:
+        # Create the shared client up front so worker threads don't race on it
+        get_http_client()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            voice: executor.submit(download_voice_prompt, voice, force)
+            for voice in VOICE_PROMPTS
+        }
+        return {voice: future.result() for voice, future in futures.items()}
+
+
 def requires_voice_prompt(model_id: str) -> bool:
     """Return True if the model requires an explicit voice prompt."""
     return "realtime" not in model_id.lower()
 
 
-def load_model(model_id: str, device: str, dtype: torch.dtype):
+# Repeated per-DDPM-step denoiser blocks, searched in order
+DENOISER_ATTRS = (
+    "model.prediction_head",
+    "prediction_head",
+    "model.diffusion_head",
+    "diffusion_head",
+    "unet",
+)
+ACOUSTIC_TOKENIZER_ATTRS = ("model.acoustic_tokenizer", "acoustic_tokenizer")
+# Small, quality-sensitive stages excluded from weight-only quantization
+QUANTIZE_SKIP_KEYWORDS = (
+    "prediction_head",
+    "diffusion_head",
+    "unet",
+    "acoustic_tokenizer",
+    "semantic_tokenizer",
+)
+QUANTIZE_MODES = ("none", "int8", "int4")
+
+
+def _find_submodule(model, paths):
+    """Return the first submodule found at one of the dotted attribute paths."""
+    for path in paths:
+        module = model
+        for name in path.split("."):
+            module = getattr(module, name, None)
+            if module is None:
+                break
+        if isinstance(module, torch.nn.Module):
+            return path, module
+    return None, None
+
+
+def int8_linear(input, weight, scales, bias):
+    """Dequantize-and-matmul for int8 weights with per-channel scales."""
+    output = torch.nn.functional.linear(input, weight.to(input.dtype))
+    output = output * scales
+    if bias is not None:
+        output = output + bias
+    return output
+
+
+class WeightOnlyInt8Linear(torch.nn.Module):
+    """nn.Linear replacement with per-channel int8 weights (gpt-fast style).
+
+    Eager, the dequantization materializes a full-precision copy of the weight
+    on every call; compile_model swaps in a compiled int8_linear that fuses it.
+    """
+
+    def __init__(self, weight: torch.Tensor, scales: torch.Tensor, bias=None):
+        super().__init__()
+        self.in_features = weight.shape[1]
+        self.out_features = weight.shape[0]
+        self.register_buffer("weight", weight)
+        self.register_buffer("scales", scales)
+        self.register_buffer("bias", bias)
+        self.linear_fn = int8_linear
+
+    @classmethod
+    def from_linear(cls, linear: torch.nn.Linear) -> "WeightOnlyInt8Linear":
+        weight = linear.weight.detach().float()
+        scales = weight.abs().amax(dim=1).clamp(min=1e-5) / 127
+        weight = torch.round(weight / scales.unsqueeze(1)).clamp(-128, 127)
+        bias = linear.bias.detach() if linear.bias is not None else None
+        return cls(
+            weight.to(torch.int8), scales.to(linear.weight.dtype), bias
+        )
+
+    def forward(self, input: torch.Tensor) -> torch.Tensor:
+        return self.linear_fn(input, self.weight, self.scales, self.bias)
+
+
+def _skip_quantize(name: str) -> bool:
+    return any(keyword in name for keyword in QUANTIZE_SKIP_KEYWORDS)
+
+
+def resolve_quantize_mode(mode: str, device: str, dtype: torch.dtype) -> str:
+    """Validate the quantization mode for the device before loading the model."""
+    if mode == "none":
+        return mode
+    if mode not in QUANTIZE_MODES:
+        raise ValueError(f"Unknown quantization mode: {mode}")
+    if device not in ("cuda", "mps"):
+        print(
+            f"Quantization ({mode}) is only enabled on cuda/mps, skipping",
+            file=sys.stderr,
+        )
+        return "none"
+    if mode == "int4":
+        # torchao's int4 kernels are CUDA-only and need bf16 weights
+        if device != "cuda" or dtype != torch.bfloat16:
+            raise RuntimeError(
+                "int4 quantization requires CUDA with bf16 (compute capability >= 8)"
+            )
+        if importlib.util.find_spec("torchao") is None:
+            raise RuntimeError("int4 quantization requires torchao")
+    return mode
+
+
+def quantize_model(model, mode: str):
+    """Apply weight-only quantization to the LLM stage's nn.Linear layers."""
+    if mode == "none":
+        return model
+
+    if mode == "int8":
+        targets = [
+            (name, module)
+            for name, module in model.named_modules()
+            if isinstance(module, torch.nn.Linear) and not _skip_quantize(name)
+        ]
+        for name, module in targets:
+            parent_name, _, child_name = name.rpartition(".")
+            parent = model.get_submodule(parent_name) if parent_name else model
+            setattr(parent, child_name, WeightOnlyInt8Linear.from_linear(module))
+        print(f"Quantized {len(targets)} linear layers to int8", file=sys.stderr)
+    elif mode == "int4":
+        from torchao.quantization import int4_weight_only, quantize_
+
+        quantize_(
+            model,
+            int4_weight_only(),
+            filter_fn=lambda module, name: isinstance(module, torch.nn.Linear)
+            and not _skip_quantize(name),
+        )
+        print("Quantized linear layers to int4", file=sys.stderr)
+    else:
+        raise ValueError(f"Unknown quantization mode: {mode}")
+
+    return model
+
+
+def static_timestep_step(step):
+    """Wrap a compiled denoiser step so timesteps always arrive as tensors.
+
+    Python scalar timesteps are specialized by Dynamo and would recompile on
+    every DDPM step; a tensor keeps one static graph that CUDA graphs replay.
+    """
+
+    def denoise_step(noisy, timesteps, *args, **kwargs):
+        if not torch.is_tensor(timesteps):
+            timesteps = torch.full(
+                (noisy.shape[0],),
+                timesteps,
+                device=noisy.device,
+                dtype=noisy.dtype,
+            )
+        return step(noisy, timesteps, *args, **kwargs)
+
+    return denoise_step
+
+
+def compile_model(model):
+    """Compile the diffusion inner loop with torch.compile, falling back to eager.
+
+    Only the denoiser and the acoustic tokenizer are compiled; the text prefill
+    path stays eager to avoid recompiles on variable-length text inputs. The
+    denoiser step has fixed shapes and is compiled static; the tokenizer sees
+    variable lengths and is compiled with dynamic shapes. The whole forward is
+    compiled only when no denoiser can be found.
+    """
+    try:
+        # Graph breaks / unsupported ops at call time fall back to eager
+        torch._dynamo.config.suppress_errors = True
+
+        path, denoiser = _find_submodule(model, DENOISER_ATTRS)
+        if denoiser is not None:
+            denoiser.forward = static_timestep_step(
+                # No fullgraph=True: it bypasses suppress_errors, so a graph
+                # break or backend failure would abort generate() instead of
+                # falling back to eager
+                torch.compile(
+                    denoiser.forward,
+                    mode=COMPILE_MODE,
+                    dynamic=False,
+                )
+            )
+            print(f"torch.compile enabled for {path}", file=sys.stderr)
+        else:
+            # Patch forward in place so generate() and attribute access still work
+            model.forward = torch.compile(
+                model.forward, mode=COMPILE_MODE, fullgraph=False
+            )
+            # Lets synthesize_transformers opt into a static KV cache
+            model._compiled_forward = True
+            print(f"torch.compile enabled (mode={COMPILE_MODE})", file=sys.stderr)
+
+        path, tokenizer = _find_submodule(model, ACOUSTIC_TOKENIZER_ATTRS)
+        if tokenizer is not None:
+            # Called with a different length per prompt/segment: let Dynamo
+            # mark lengths dynamic after the first recompile, and skip CUDA
+            # graphs, which would be recorded once per length
+            for method in ("encode", "decode"):
+                if hasattr(tokenizer, method):
+                    setattr(
+                        tokenizer,
+                        method,
+                        torch.compile(getattr(tokenizer, method), dynamic=None),
+                    )
+            print(f"torch.compile enabled for {path}", file=sys.stderr)
+
+        int8_linears = [
+            module
+            for module in model.modules()
+            if isinstance(module, WeightOnlyInt8Linear)
+        ]
+        if int8_linears:
+            # One compiled function shared by all layers fuses the int8
+            # dequantization into the matmul
+            compiled_linear = torch.compile(int8_linear, dynamic=None)
+            for module in int8_linears:
+                module.linear_fn = compiled_linear
+            print(
+                f"torch.compile enabled for {len(int8_linears)} int8 linear layers",
+                file=sys.stderr,
+            )
+    except Exception as e:
+        print(f"torch.compile unavailable, running eager: {e}", file=sys.stderr)
+    return model
+
+
+def prepare_model(model, use_compile: bool, quantize: str):
+    """Quantize and compile a loaded model according to CLI options."""
+    model = quantize_model(model, quantize)
+    if use_compile:
+        model = compile_model(model)
+    return model
+
+
+def load_model(
+    model_id: str,
+    device: str,
+    dtype: torch.dtype,
+    use_compile: bool = False,
+    quantize: str = "none",
+):
+    """Load the VibeVoice model, then quantize and compile it."""
+    quantize = resolve_quantize_mode(quantize, device, dtype)
+
+    # Kept outside the loaders so quantize/compile errors are not mistaken
+    # for load failures and never trigger a second load through a fallback
+    model = load_model_eager(model_id, device, dtype)
+    if isinstance(model, dict):
+        model["model"] = prepare_model(model["model"], use_compile, quantize)
+    else:
+        model = prepare_model(model, use_compile, quantize)
+    return model
+
+
+def load_model_eager(model_id: str, device: str, dtype: torch.dtype):
     """Load the VibeVoice model."""
     try:
         from vibevoice.modular.modeling_vibevoice_inference import (
@@ -121,7 +478,7 @@ def load_model(model_id: str, device: str, dtype: torch.dtype):
 
         processor = VibeVoiceProcessor.from_pretrained(model_id)
         model = VibeVoiceForConditionalGenerationInference.from_pretrained(
-            model_id, torch_dtype=dtype
+            model_id, torch_dtype=dtype, low_cpu_mem_usage=True
         )
         model = model.to(device=device)
         # Set to inference mode (same as model.eval())
@@ -164,12 +521,16 @@ def load_model_transformers(model_id: str, device: str, dtype: torch.dtype):
         model_id,
         torch_dtype=dtype,
         trust_remote_code=True,
+        low_cpu_mem_usage=True,
     )
     model = model.to(device)
     # Set to inference mode (same as model.eval())
     model.train(False)
 
-    processor = AutoProcessor.from_pretrained(model_id, trust_remote_code=True)
+    # Rust tokenizers backend; slow tokenizers are converted on load
+    processor = AutoProcessor.from_pretrained(
+        model_id, trust_remote_code=True, use_fast=True
+    )
 
     return {"model": model, "processor": processor}
 
@@ -197,12 +558,13 @@ def synthesize_vibevoice(
 
         if isinstance(model, VibeVoice):
             # Official vibevoice API
-            audio, sr = model.tts(
-                text=text,
-                voice_prompt=str(voice_prompt_path),
-                ddpm_steps=ddpm_steps,
-                cfg_scale=cfg_scale,
-            )
+            with torch.inference_mode():
+                audio, sr = model.tts(
+                    text=text,
+                    voice_prompt=str(voice_prompt_path),
+                    ddpm_steps=ddpm_steps,
+                    cfg_scale=cfg_scale,
+                )
             return audio, sr
 
     except (ImportError, AttributeError):
@@ -222,6 +584,205 @@ def synthesize_vibevoice(
     raise RuntimeError("Unable to synthesize: incompatible model type")
 
 
+def attention_context(device):
+    """Prefer the fused FlashAttention/memory-efficient SDPA kernels on CUDA.
+
+    MATH stays last so inputs neither fused kernel accepts (dtype, mask,
+    head_dim) still run instead of failing with "No available kernel".
+    """
+    if torch.device(device).type != "cuda":
+        return contextlib.nullcontext()
+    try:
+        from torch.nn.attention import SDPBackend, sdpa_kernel
+    except ImportError:
+        return contextlib.nullcontext()
+    return sdpa_kernel(
+        [
+            SDPBackend.FLASH_ATTENTION,
+            SDPBackend.EFFICIENT_ATTENTION,
+            SDPBackend.MATH,
+        ]
+    )
+
+
+def create_static_cache(model, batch_size: int):
+    """Pre-allocate a fixed-size KV cache so a compiled LM keeps static shapes.
+
+    Only worth it when the LM forward is compiled: eager attention would run
+    over all MAX_CACHE_LEN positions instead of the real prefix.
+    """
+    if not getattr(model, "_compiled_forward", False):
+        return None
+    try:
+        from transformers import StaticCache
+
+        return StaticCache(
+            config=model.config,
+            max_batch_size=batch_size,
+            max_cache_len=MAX_CACHE_LEN,
+            device=model.device,
+            dtype=model.dtype,
+        )
+    except (ImportError, TypeError, ValueError) as e:
+        print(f"Static KV cache unavailable, using dynamic: {e}", file=sys.stderr)
+        return None
+
+
+def move_inputs(inputs, device) -> dict:
+    """Copy processor outputs to the device in a single pass."""
+    moved = {}
+    for key, value in inputs.items():
+        if isinstance(value, torch.Tensor):
+            value = value.to(device)
+        moved[key] = value
+    return moved
+
+
+def load_voice_prompt_audio(voice_prompt_path: Path) -> tuple:
+    """Decode only the conditioning window of a voice prompt as mono float32."""
+    with sf.SoundFile(str(voice_prompt_path)) as f:
+        prompt_sr = f.samplerate
+        prompt_audio = f.read(
+            frames=min(f.frames, prompt_sr * MAX_PROMPT_SECS),
+            dtype="float32",
+            always_2d=False,
+        )
+    if prompt_audio.ndim > 1:
+        # Convert to mono without upcasting to float64
+        prompt_audio = prompt_audio.mean(axis=1, dtype=np.float32)
+    return prompt_audio, prompt_sr
+
+
+def get_voice_condition_path(
+    voice_prompt_path: Path, processor, model_id: str, dtype: torch.dtype
+) -> Path:
+    """Get the cache path of the encoded conditioning for a voice prompt."""
+    import transformers
+
+    stat = voice_prompt_path.stat()
+    key = ":".join(
+        [
+            str(voice_prompt_path.resolve()),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            model_id,
+            str(dtype),
+            f"{type(processor).__module__}.{type(processor).__qualname__}",
+            transformers.__version__,
+        ]
+    )
+    return get_cache_dir() / f"{voice_prompt_path.stem}_{short_hash(key)}.cond.pt"
+
+
+def _inputs_equal(a: dict, b: dict) -> bool:
+    """Return True if two processor outputs hold identical values."""
+    if a.keys() != b.keys():
+        return False
+    for key, value in a.items():
+        other = b[key]
+        if isinstance(value, torch.Tensor) and isinstance(other, torch.Tensor):
+            if value.shape != other.shape or not torch.equal(value, other):
+                return False
+        elif type(value) is not type(other) or value != other:
+            return False
+    return True
+
+
+def merge_voice_features(text_inputs: dict, features: dict) -> dict:
+    """Merge cached voice prompt features into text-only processor outputs."""
+    clash = text_inputs.keys() & features.keys()
+    if clash:
+        raise ValueError(
+            f"Voice prompt features clash with text inputs: {sorted(clash)}"
+        )
+    return {**text_inputs, **features}
+
+
+def _load_voice_condition(cond_path: Path) -> Optional[dict]:
+    if not cond_path.exists():
+        return None
+    try:
+        condition = torch.load(cond_path, map_location="cpu", weights_only=True)
+    except Exception as e:
+        print(f"Ignoring unreadable conditioning cache: {e}", file=sys.stderr)
+        return None
+    if not isinstance(condition, dict) or "split" not in condition:
+        return None
+    return condition
+
+
+def _save_voice_condition(cond_path: Path, condition: dict):
+    fd, tmp_path = tempfile.mkstemp(
+        dir=cond_path.parent, prefix=f"{cond_path.stem}.", suffix=".pt.tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            torch.save(condition, f)
+        os.replace(tmp_path, cond_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def build_transformers_inputs(
+    processor,
+    text: str,
+    voice_prompt_path: Path,
+    model_id: str,
+    dtype: torch.dtype,
+) -> dict:
+    """Build processor inputs, reusing cached voice prompt features when safe.
+
+    The voice prompt can only be encoded separately from the text if doing so
+    reproduces the joint processor(text=..., audio=...) output. That is checked
+    on the first run and recorded in the cache; processors that fail the check
+    always use the joint call.
+    """
+    cond_path = get_voice_condition_path(voice_prompt_path, processor, model_id, dtype)
+    condition = _load_voice_condition(cond_path)
+    if condition is not None and condition["split"]:
+        text_inputs = dict(processor(text=text, return_tensors="pt"))
+        return merge_voice_features(text_inputs, condition["features"])
+
+    prompt_audio, prompt_sr = load_voice_prompt_audio(voice_prompt_path)
+    inputs = dict(
+        processor(
+            text=text,
+            audio=prompt_audio,
+            sampling_rate=prompt_sr,
+            return_tensors="pt",
+        )
+    )
+    if condition is not None:
+        # Already recorded as not splittable
+        return inputs
+
+    split = False
+    features = {}
+    try:
+        text_inputs = dict(processor(text=text, return_tensors="pt"))
+        features = dict(
+            processor(audio=prompt_audio, sampling_rate=prompt_sr, return_tensors="pt")
+        )
+        split = (
+            all(isinstance(value, torch.Tensor) for value in features.values())
+            and not (text_inputs.keys() & features.keys())
+            and _inputs_equal({**text_inputs, **features}, inputs)
+        )
+    except Exception as e:
+        print(f"Voice prompt cannot be encoded separately: {e}", file=sys.stderr)
+
+    if not split:
+        print(
+            "Voice prompt features depend on the text, not caching them",
+            file=sys.stderr,
+        )
+        features = {}
+    _save_voice_condition(cond_path, {"split": split, "features": features})
+
+    return inputs
+
+
 def synthesize_transformers(
     model,
     processor,
@@ -234,27 +795,30 @@ def synthesize_transformers(
     if voice_prompt_path is None:
         raise RuntimeError("voice_prompt is required for this model")
 
-    # Load voice prompt audio
-    prompt_audio, prompt_sr = sf.read(voice_prompt_path)
-    if len(prompt_audio.shape) > 1:
-        prompt_audio = prompt_audio.mean(axis=1)  # Convert to mono
-
-    # Prepare inputs
-    inputs = processor(
-        text=text,
-        audio=prompt_audio,
-        sampling_rate=prompt_sr,
-        return_tensors="pt",
+    # Prepare inputs (voice prompt features are cached on disk when safe)
+    inputs = build_transformers_inputs(
+        processor, text, voice_prompt_path, model.config.name_or_path, model.dtype
     )
-    inputs = {k: v.to(model.device) for k, v in inputs.items()}
+    inputs = move_inputs(inputs, model.device)
+
+    generate_kwargs = dict(inputs, ddpm_steps=ddpm_steps, cfg_scale=cfg_scale)
+    batch_size = inputs["input_ids"].shape[0] if "input_ids" in inputs else 1
 
     # Generate
-    with torch.no_grad():
-        outputs = model.generate(
-            **inputs,
-            ddpm_steps=ddpm_steps,
-            cfg_scale=cfg_scale,
-        )
+    with torch.inference_mode(), attention_context(model.device):
+        outputs = None
+        cache = create_static_cache(model, batch_size)
+        if cache is not None:
+            try:
+                outputs = model.generate(**generate_kwargs, past_key_values=cache)
+            except (RuntimeError, TypeError, ValueError) as e:
+                # e.g. CFG doubling the batch beyond the pre-allocated cache
+                print(
+                    f"Static KV cache rejected, retrying with dynamic: {e}",
+                    file=sys.stderr,
+                )
+        if outputs is None:
+            outputs = model.generate(**generate_kwargs)
 
     # Extract audio
     if hasattr(outputs, "audio"):
@@ -296,17 +860,14 @@ def synthesize_vibevoice_modular(
     model_inputs = {}
     for key in ["input_ids", "attention_mask", "speech_tensors",
                 "speech_masks", "speech_input_mask"]:
-        if key not in inputs:
-            continue
-        value = inputs[key]
-        if hasattr(value, "to"):
-            value = value.to(model.device)
-        model_inputs[key] = value
+        if key in inputs:
+            model_inputs[key] = inputs[key]
+    model_inputs = move_inputs(model_inputs, model.device)
 
     if hasattr(model, "set_ddpm_inference_steps"):
         model.set_ddpm_inference_steps(ddpm_steps)
 
-    with torch.no_grad():
+    with torch.inference_mode(), attention_context(model.device):
         outputs = model.generate(
             **model_inputs,
             cfg_scale=cfg_scale,
@@ -334,12 +895,23 @@ def get_device_dtype(device: str) -> tuple:
         if not torch.backends.mps.is_available():
             print("MPS not available, falling back to CPU", file=sys.stderr)
             device = "cpu"
-        dtype = torch.float16
+            dtype = torch.float32
+        else:
+            # VibeVoice is bf16-trained; MPS supports bf16 on macOS 14+
+            is_macos_or_newer = getattr(torch.backends.mps, "is_macos_or_newer", None)
+            if is_macos_or_newer is not None and is_macos_or_newer(14, 0):
+                dtype = torch.bfloat16
+            else:
+                dtype = torch.float16
     elif device == "cuda":
         if not torch.cuda.is_available():
             print("CUDA not available, falling back to CPU", file=sys.stderr)
             device = "cpu"
-        dtype = torch.float16
+            dtype = torch.float32
+        else:
+            # bf16 tensor cores are available on Ampere (sm_80) and newer
+            major, _ = torch.cuda.get_device_capability()
+            dtype = torch.bfloat16 if major >= 8 else torch.float16
     else:
         device = "cpu"
         dtype = torch.float32
@@ -347,6 +919,24 @@ def get_device_dtype(device: str) -> tuple:
     return device, dtype
 
 
+def configure_cpu_threads():
+    """Limit inter-op threads for CPU inference unless the user already tuned it."""
+    # OMP_NUM_THREADS only sizes the intra-op pool, but setting it signals the
+    # user is tuning threading themselves, so leave both pools alone
+    if "OMP_NUM_THREADS" in os.environ:
+        return
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set before any inter-op parallel work has started
+        pass
+    print(
+        f"CPU threads: {torch.get_num_threads()} intra-op, "
+        f"{torch.get_num_interop_threads()} inter-op",
+        file=sys.stderr,
+    )
+
+
 def list_voices():
     """Print available voices."""
     print("Available voices:")
@@ -355,6 +945,9 @@ def list_voices():
 
 
 def main():
+    # Inference only: no autograd bookkeeping anywhere in this process
+    torch.autograd.set_grad_enabled(False)
+
     parser = argparse.ArgumentParser(
         description="VibeVoice TTS Runner for LLM Router",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -369,8 +962,11 @@ Examples:
   # List available voices
   %(prog)s --list-voices
 
+  # Download all voice prompts into the cache
+  %(prog)s --prefetch-all
+
 Environment variables:
-  HF_HOME    Hugging Face cache directory
+  HF_HOME    Hugging Face cache directory (also hosts torch_compile_cache)
   HF_TOKEN   Hugging Face token for authenticated downloads
         """,
     )
@@ -398,6 +994,29 @@ Environment variables:
         default=DEFAULT_CFG_SCALE,
         help=f"CFG scale for generation (default: {DEFAULT_CFG_SCALE})",
     )
+    parser.add_argument(
+        "--compile",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Compile the model with torch.compile "
+        "(default: enabled on cuda/mps, disabled on cpu)",
+    )
+    parser.add_argument(
+        "--compile-cache-dir",
+        type=str,
+        default=None,
+        help="torch.compile cache directory "
+        "(default: $HF_HOME/torch_compile_cache)",
+    )
+    parser.add_argument(
+        "--quantize",
+        default="none",
+        choices=QUANTIZE_MODES,
+        help="Weight-only quantization for the LLM stage on cuda/mps "
+        "(default: none). int8 only speeds up with --compile, which fuses the "
+        "dequantization; eager int8 saves memory but is slower. int4 requires "
+        "CUDA with bf16 and torchao",
+    )
     parser.add_argument(
         "--voice",
         default=DEFAULT_VOICE,
@@ -419,11 +1038,21 @@ Environment variables:
         default="output.wav",
         help="Output WAV file path (default: output.wav)",
     )
+    parser.add_argument(
+        "--emit-silence",
+        action="store_true",
+        help="Write one second of silence to --out without loading the model",
+    )
     parser.add_argument(
         "--list-voices",
         action="store_true",
         help="List available voices and exit",
     )
+    parser.add_argument(
+        "--prefetch-all",
+        action="store_true",
+        help="Download all voice prompts into the cache (exits if --text is omitted)",
+    )
     parser.add_argument(
         "--force-download",
         action="store_true",
@@ -437,6 +1066,32 @@ Environment variables:
         list_voices()
         return 0
 
+    # Handle --prefetch-all
+    if args.prefetch_all:
+        try:
+            for voice, path in prefetch_all_voices(force=args.force_download).items():
+                print(f"  {voice}: {path}")
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        if not args.text:
+            return 0
+
+    # Handle --emit-silence (no model load)
+    if args.emit_silence:
+        output_path = Path(args.out)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        sr = DEFAULT_SAMPLE_RATE
+        sf.write(
+            str(output_path),
+            np.zeros(sr, dtype=np.int16),
+            sr,
+            format="WAV",
+            subtype="PCM_16",
+        )
+        print(f"Silence written: {output_path} ({sr} Hz)", file=sys.stderr)
+        return 0
+
     # Validate required arguments
     if not args.text:
         parser.error("--text is required")
@@ -445,6 +1100,8 @@ Environment variables:
         # Get device and dtype
         device, dtype = get_device_dtype(args.device)
         print(f"Using device: {device}, dtype: {dtype}", file=sys.stderr)
+        if device == "cpu":
+            configure_cpu_threads()
 
         # Get voice prompt path if required by model
         voice_prompt_path: Optional[Path] = None
@@ -461,7 +1118,17 @@ Environment variables:
             print(f"Voice prompt: {voice_prompt_path}", file=sys.stderr)
 
         # Load model
-        model = load_model(args.model, device, dtype)
+        use_compile = args.compile if args.compile is not None else device != "cpu"
+        if use_compile:
+            compile_cache_dir = configure_compile_cache(args.compile_cache_dir)
+            print(f"Compile cache: {compile_cache_dir}", file=sys.stderr)
+        model = load_model(
+            args.model,
+            device,
+            dtype,
+            use_compile=use_compile,
+            quantize=args.quantize,
+        )
 
         # Synthesize
         print(f"Synthesizing: {args.text[:50]}...", file=sys.stderr)